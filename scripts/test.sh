@@ -50,7 +50,10 @@ export ZEPHYR_SCALE_DEFAULT_PROJECT_KEY="TEST"
 
 # Clean up any previous test artifacts
 print_status "Cleaning up previous test artifacts..."
-rm -rf .pytest_cache htmlcov .coverage
+rm -rf htmlcov .coverage
+
+# Coverage is opt-in so that plain "pytest" runs skip coverage tracing
+COV_ARGS="--cov=src/mcp_zephyr_scale_cloud --cov-report=term-missing"
 
 # Run linting first
 print_status "Running code quality checks..."
@@ -76,28 +79,36 @@ poetry run mypy src/ || {
 case "${1:-all}" in
     "unit")
         print_status "Running unit tests only..."
-        poetry run pytest tests/unit/ -v
+        poetry run pytest tests/unit/ -v $COV_ARGS
         ;;
     "integration") 
         print_status "Running integration tests only..."
         poetry run pytest tests/integration/ -v
         ;;
+    "parallel")
+        print_status "Running tests in parallel with pytest-xdist..."
+        if ! poetry run python -c "import xdist" 2>/dev/null; then
+            print_error "pytest-xdist is not installed. Run 'poetry install' to get the dev dependencies."
+            exit 1
+        fi
+        poetry run pytest tests/ -v -n auto
+        ;;
     "fast")
-        print_status "Running fast tests only (no coverage)..."
-        poetry run pytest tests/ -v --no-cov -x
+        print_status "Running non-integration tests (no coverage, only last failures if any)..."
+        poetry run pytest tests/ -v -x -m "not integration" --lf
         ;;
     "coverage")
         print_status "Running tests with detailed coverage..."
-        poetry run pytest tests/ -v --cov-report=html --cov-report=term-missing
+        poetry run pytest tests/ -v $COV_ARGS --cov-report=html
         print_status "Coverage report generated in htmlcov/"
         ;;
     "ci")
         print_status "Running CI test suite..."
-        poetry run pytest tests/ -v --tb=short --strict-markers
+        poetry run pytest tests/ -v --tb=short --strict-markers -p no:cacheprovider $COV_ARGS
         ;;
     "all"|*)
         print_status "Running complete test suite..."
-        poetry run pytest tests/ -v
+        poetry run pytest tests/ -v $COV_ARGS
         ;;
 esac
 
@@ -1,45 +1,171 @@
 """Pytest configuration and shared fixtures."""
 
-import asyncio
-import os
+import copy
 from collections.abc import Generator
+from types import SimpleNamespace
 from unittest.mock import AsyncMock
 
 import httpx
 import pytest
+import pytest_asyncio
 from pydantic import ValidationError
 
+from src.mcp_zephyr_scale_cloud import server
 from src.mcp_zephyr_scale_cloud.clients.zephyr_client import ZephyrClient
 from src.mcp_zephyr_scale_cloud.config import ZephyrConfig
+from src.mcp_zephyr_scale_cloud.schemas.common import ProjectLink
+from src.mcp_zephyr_scale_cloud.schemas.priority import (
+    CreatePriorityRequest,
+    PriorityLink,
+)
+from src.mcp_zephyr_scale_cloud.schemas.status import StatusLink
+from src.mcp_zephyr_scale_cloud.schemas.test_case import (
+    IssueLink,
+    TestCase,
+    TestCaseLinkList,
+    WebLink,
+)
+from src.mcp_zephyr_scale_cloud.schemas.test_plan import TestPlan, TestPlanList
+from src.mcp_zephyr_scale_cloud.schemas.version import (
+    TestCaseVersionLink,
+    TestCaseVersionList,
+)
+from src.mcp_zephyr_scale_cloud.server import mcp
+
+# List pages served by the sample_*_list fixtures. The fixtures return deep
+# copies, so a test that mutates its page cannot affect other tests.
+_PROJECT_LINK = {
+    "id": 123,
+    "key": "TEST",
+    "self": "https://api.example.com/v2/projects/123",
+}
+
+_PRIORITY_LIST = {
+    "values": [
+        {
+            "id": 1,
+            "name": "Low",
+            "description": "Low priority",
+            "index": 0,
+            "default": False,
+            "color": "#00FF00",
+            "project": _PROJECT_LINK,
+            "self": "https://api.example.com/v2/priorities/1",
+        },
+        {
+            "id": 2,
+            "name": "High",
+            "description": "High priority",
+            "index": 1,
+            "default": True,
+            "color": "#FF0000",
+            "project": _PROJECT_LINK,
+            "self": "https://api.example.com/v2/priorities/2",
+        },
+    ],
+    "total": 2,
+    "maxResults": 50,
+    "startAt": 0,
+    "isLast": True,
+}
+
+_STATUS_LIST = {
+    "values": [
+        {
+            "id": 1,
+            "name": "Pass",
+            "description": "Test passed successfully",
+            "index": 0,
+            "default": True,
+            "archived": False,
+            "color": "#00FF00",
+            "project": _PROJECT_LINK,
+        },
+        {
+            "id": 2,
+            "name": "Fail",
+            "description": "Test failed",
+            "index": 1,
+            "default": False,
+            "archived": False,
+            "color": "#FF0000",
+            "project": _PROJECT_LINK,
+        },
+        {
+            "id": 3,
+            "name": "In Progress",
+            "description": "Test is in progress",
+            "index": 2,
+            "default": False,
+            "archived": False,
+            "color": "#FFA500",
+            "project": _PROJECT_LINK,
+        },
+    ],
+    "total": 3,
+    "maxResults": 50,
+    "startAt": 0,
+    "isLast": True,
+}
+
+_FOLDER_LIST = {
+    "values": [
+        {
+            "id": 1,
+            "parentId": None,
+            "name": "Test Cases",
+            "index": 0,
+            "folderType": "TEST_CASE",
+            "project": _PROJECT_LINK,
+        },
+        {
+            "id": 2,
+            "parentId": 1,
+            "name": "Smoke Tests",
+            "index": 1,
+            "folderType": "TEST_CASE",
+            "project": _PROJECT_LINK,
+        },
+        {
+            "id": 3,
+            "parentId": None,
+            "name": "Test Plans",
+            "index": 0,
+            "folderType": "TEST_PLAN",
+            "project": _PROJECT_LINK,
+        },
+    ],
+    "total": 3,
+    "maxResults": 50,
+    "startAt": 0,
+    "isLast": True,
+}
 
 
 @pytest.fixture(scope="session")
-def event_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
-
-
-@pytest.fixture
 def mock_env_vars() -> Generator[dict[str, str], None, None]:
-    """Mock environment variables for testing."""
-    original_env = os.environ.copy()
+    """Mock environment variables for the whole test session.
+
+    The values never change between tests, so they are applied once. Tests that
+    need to remove or override a variable should use ``monkeypatch`` so the
+    change is undone before the next test runs.
+    """
     test_env = {
         "ZEPHYR_SCALE_API_TOKEN": "test_token_123",
         "ZEPHYR_SCALE_BASE_URL": "https://api.example.com/v2",
         "ZEPHYR_SCALE_DEFAULT_PROJECT_KEY": "TEST",
     }
 
-    os.environ.update(test_env)
+    mp = pytest.MonkeyPatch()
+    for name, value in test_env.items():
+        mp.setenv(name, value)
     yield test_env
 
     # Restore original environment
-    os.environ.clear()
-    os.environ.update(original_env)
+    mp.undo()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_config(mock_env_vars) -> ZephyrConfig:
     """Create a mock ZephyrConfig for testing."""
     return ZephyrConfig.from_env()
@@ -68,42 +194,7 @@ def sample_priority_data() -> dict:
 @pytest.fixture
 def sample_priority_list() -> dict:
     """Sample priority list response for testing."""
-    return {
-        "values": [
-            {
-                "id": 1,
-                "name": "Low",
-                "description": "Low priority",
-                "index": 0,
-                "default": False,
-                "color": "#00FF00",
-                "project": {
-                    "id": 123,
-                    "key": "TEST",
-                    "self": "https://api.example.com/v2/projects/123",
-                },
-                "self": "https://api.example.com/v2/priorities/1",
-            },
-            {
-                "id": 2,
-                "name": "High",
-                "description": "High priority",
-                "index": 1,
-                "default": True,
-                "color": "#FF0000",
-                "project": {
-                    "id": 123,
-                    "key": "TEST",
-                    "self": "https://api.example.com/v2/projects/123",
-                },
-                "self": "https://api.example.com/v2/priorities/2",
-            },
-        ],
-        "total": 2,
-        "maxResults": 50,
-        "startAt": 0,
-        "isLast": True,
-    }
+    return copy.deepcopy(_PRIORITY_LIST)
 
 
 @pytest.fixture
@@ -113,12 +204,41 @@ def mock_httpx_client() -> AsyncMock:
     return mock_client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_zephyr_client(mock_config: ZephyrConfig) -> ZephyrClient:
-    """Create a ZephyrClient instance for testing."""
+    """Create a ZephyrClient instance for testing.
+
+    The client holds no connection state (every request opens its own
+    ``httpx.AsyncClient``), so a single instance is shared by the session.
+    """
     return ZephyrClient(mock_config)
 
 
+@pytest.fixture
+def stub_client(monkeypatch) -> SimpleNamespace:
+    """Install an empty namespace as the server's module-level client.
+
+    Tests attach only the client methods the tool calls, usually as
+    ``tests.helpers.AsyncStub`` instances; calling any other method fails with
+    ``AttributeError``. ``monkeypatch`` restores the original client afterwards.
+    """
+    client = SimpleNamespace()
+    monkeypatch.setattr(server, "zephyr_client", client)
+    return client
+
+
+@pytest.fixture
+def zephyr_http_client(monkeypatch, mock_zephyr_client: ZephyrClient) -> ZephyrClient:
+    """Install the session's real ZephyrClient as the server's module-level client.
+
+    Pair it with pytest-httpx's ``httpx_mock`` fixture so a tool call runs
+    through the server, client and schema layers and only the HTTP responses
+    are canned.
+    """
+    monkeypatch.setattr(server, "zephyr_client", mock_zephyr_client)
+    return mock_zephyr_client
+
+
 @pytest.fixture
 def sample_created_resource() -> dict:
     """Sample created resource response."""
@@ -151,56 +271,7 @@ def sample_status_data() -> dict:
 @pytest.fixture
 def sample_status_list() -> dict:
     """Sample status list response for testing (matches actual API response format)."""
-    return {
-        "values": [
-            {
-                "id": 1,
-                "name": "Pass",
-                "description": "Test passed successfully",
-                "index": 0,
-                "default": True,
-                "archived": False,
-                "color": "#00FF00",
-                "project": {
-                    "id": 123,
-                    "key": "TEST",
-                    "self": "https://api.example.com/v2/projects/123",
-                },
-            },
-            {
-                "id": 2,
-                "name": "Fail",
-                "description": "Test failed",
-                "index": 1,
-                "default": False,
-                "archived": False,
-                "color": "#FF0000",
-                "project": {
-                    "id": 123,
-                    "key": "TEST",
-                    "self": "https://api.example.com/v2/projects/123",
-                },
-            },
-            {
-                "id": 3,
-                "name": "In Progress",
-                "description": "Test is in progress",
-                "index": 2,
-                "default": False,
-                "archived": False,
-                "color": "#FFA500",
-                "project": {
-                    "id": 123,
-                    "key": "TEST",
-                    "self": "https://api.example.com/v2/projects/123",
-                },
-            },
-        ],
-        "total": 3,
-        "maxResults": 50,
-        "startAt": 0,
-        "isLast": True,
-    }
+    return copy.deepcopy(_STATUS_LIST)
 
 
 @pytest.fixture
@@ -223,69 +294,128 @@ def sample_folder_data() -> dict:
 @pytest.fixture
 def sample_folder_list() -> dict:
     """Sample folder list response for testing."""
-    return {
-        "values": [
-            {
-                "id": 1,
-                "parentId": None,
-                "name": "Test Cases",
-                "index": 0,
-                "folderType": "TEST_CASE",
-                "project": {
-                    "id": 123,
-                    "key": "TEST",
-                    "self": "https://api.example.com/v2/projects/123",
-                },
-            },
-            {
-                "id": 2,
-                "parentId": 1,
-                "name": "Smoke Tests",
-                "index": 1,
-                "folderType": "TEST_CASE",
-                "project": {
-                    "id": 123,
-                    "key": "TEST",
-                    "self": "https://api.example.com/v2/projects/123",
-                },
-            },
-            {
-                "id": 3,
-                "parentId": None,
-                "name": "Test Plans",
-                "index": 0,
-                "folderType": "TEST_PLAN",
-                "project": {
-                    "id": 123,
-                    "key": "TEST",
-                    "self": "https://api.example.com/v2/projects/123",
-                },
-            },
-        ],
-        "total": 3,
-        "maxResults": 50,
-        "startAt": 0,
-        "isLast": True,
-    }
+    return copy.deepcopy(_FOLDER_LIST)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_validation_error() -> ValidationError:
     """Sample Pydantic validation error for testing."""
     try:
-        from src.mcp_zephyr_scale_cloud.schemas.priority import CreatePriorityRequest
-
         CreatePriorityRequest(projectKey="", name="")  # Invalid data
     except ValidationError as e:
         return e
 
-    # Fallback if no error is raised
-    from pydantic import BaseModel, Field
+    raise RuntimeError("CreatePriorityRequest accepted invalid data")
 
-    class TestModel(BaseModel):
-        required_field: str = Field(..., min_length=1)
 
-    try:
-        TestModel(required_field="")
-    except ValidationError as e:
-        return e
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def mcp_tool_names() -> frozenset[str]:
+    """Names of the tools registered on the MCP server.
+
+    Registration happens at import time, so the registry is listed once per
+    session instead of once per test.
+    """
+    return frozenset(tool.name for tool in await mcp.list_tools())
+
+
+# The test case and test plan payloads below are known-good, so they skip
+# validation via model_construct; the tools only serialize them.
+@pytest.fixture(scope="session")
+def sample_test_case_version_list() -> TestCaseVersionList:
+    """Single-version list for test case PROJ-T1234."""
+    return TestCaseVersionList.model_construct(
+        values=[
+            TestCaseVersionLink.model_construct(
+                id=1, self="https://api.example.com/testcases/PROJ-T1234/versions/1"
+            )
+        ],
+        startAt=0,
+        maxResults=10,
+        total=1,
+        isLast=True,
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_test_case() -> TestCase:
+    """Test case PROJ-T1234 with project, priority and status links."""
+    return TestCase.model_construct(
+        id=12345,
+        key="PROJ-T1234",
+        name="Test case version 2",
+        project=ProjectLink.model_construct(
+            id=10001, self="https://api.example.com/projects/10001"
+        ),
+        priority=PriorityLink.model_construct(
+            id=10002, self="https://api.example.com/priorities/10002"
+        ),
+        status=StatusLink.model_construct(
+            id=10003, self="https://api.example.com/statuses/10003"
+        ),
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_test_case_links() -> TestCaseLinkList:
+    """Links of test case PROJ-T1234: one issue link and one web link."""
+    return TestCaseLinkList.model_construct(
+        self="https://api.example.com/testcases/PROJ-T1234/links",
+        issues=[
+            IssueLink.model_construct(
+                id=1,
+                issueId=12345,
+                self="https://api.example.com/links/1",
+                target="https://jira.example.com/issue/12345",
+                type="COVERAGE",
+            )
+        ],
+        webLinks=[
+            WebLink.model_construct(
+                id=2,
+                url="https://example.com",
+                description="Example link",
+                self="https://api.example.com/weblinks/2",
+                type="RELATED",
+            )
+        ],
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_test_plan() -> TestPlan:
+    """Test plan PROJ-P1 with an objective."""
+    return TestPlan.model_construct(
+        id=1,
+        key="PROJ-P1",
+        name="Integration Test Plan",
+        project=ProjectLink.model_construct(id=10000),
+        status=StatusLink.model_construct(id=1),
+        objective="Test all features",
+    )
+
+
+@pytest.fixture(scope="session")
+def sample_test_plan_list() -> TestPlanList:
+    """Page holding test plans PROJ-P1 and PROJ-P2."""
+    return TestPlanList.model_construct(
+        maxResults=10,
+        startAt=0,
+        total=2,
+        isLast=True,
+        values=[
+            TestPlan.model_construct(
+                id=1,
+                key="PROJ-P1",
+                name="Integration Plan",
+                project=ProjectLink.model_construct(id=10000),
+                status=StatusLink.model_construct(id=1),
+            ),
+            TestPlan.model_construct(
+                id=2,
+                key="PROJ-P2",
+                name="Regression Plan",
+                project=ProjectLink.model_construct(id=10000),
+                status=StatusLink.model_construct(id=1),
+            ),
+        ],
+    )
@@ -0,0 +1,79 @@
+"""Test doubles and constants shared across the test suite."""
+
+# Tool names the MCP server must register.
+EXPECTED_TOOLS = frozenset(
+    {
+        "healthcheck",
+        "get_priorities",
+        "get_priority",
+        "create_priority",
+        "update_priority",
+        "get_statuses",
+        "get_status",
+        "create_status",
+        "update_status",
+        "get_folders",
+        "get_folder",
+        "create_folder",
+        "get_test_steps",
+        "create_test_steps",
+        "get_test_script",
+        "create_test_script",
+        "get_test_case",
+        "get_test_case_versions",
+        "get_test_case_version",
+        "get_links",
+        "create_issue_link",
+        "create_web_link",
+        "create_test_case",
+        "update_test_case",
+    }
+)
+
+
+class ConstReturn:
+    """Callable stub that ignores its arguments and returns a fixed value.
+
+    Use it instead of ``MagicMock(return_value=...)`` when a patched function
+    is only called for its result and the test never inspects the call.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def __call__(self, *args, **kwargs):
+        return self.value
+
+
+class AsyncStub:
+    """Async callable stub that returns a fixed value and counts its calls.
+
+    A cheaper stand-in for ``AsyncMock(return_value=...)`` when a test only
+    needs the awaited result and, at most, how often and with what the stub was
+    called (``calls``, ``last_call`` and ``assert_called_once_with``).
+    """
+
+    __slots__ = ("value", "calls", "last_call")
+
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+        self.last_call = None
+
+    async def __call__(self, *args, **kwargs):
+        self.calls += 1
+        self.last_call = (args, kwargs)
+        return self.value
+
+    def assert_called_once_with(self, *args, **kwargs):
+        """Assert the stub was awaited exactly once, with these arguments."""
+        assert self.calls == 1, f"expected 1 call, got {self.calls}"
+        assert self.last_call == (args, kwargs), f"called with {self.last_call}"
+
+
+def assert_contains_all(text, *needles):
+    """Assert that ``text`` contains every needle, reporting all that are missing."""
+    missing = [needle for needle in needles if needle not in text]
+    assert not missing, f"missing {missing} in {text!r}"
@@ -7,13 +7,13 @@ import pytest
 from src.mcp_zephyr_scale_cloud.config import ZephyrConfig
 from src.mcp_zephyr_scale_cloud.schemas.priority import CreatePriorityRequest
 from src.mcp_zephyr_scale_cloud.schemas.status import CreateStatusRequest, StatusType
-from src.mcp_zephyr_scale_cloud.server import mcp
 from src.mcp_zephyr_scale_cloud.utils.validation import (
     ValidationResult,
     validate_pagination_params,
     validate_project_key,
     validate_status_type,
 )
+from tests.helpers import EXPECTED_TOOLS
 
 
 class TestBasicFunctionality:
@@ -113,41 +113,10 @@ class TestBasicFunctionality:
         result = validate_pagination_params(start_at=-1)  # negative
         assert not result.is_valid
 
-    @pytest.mark.asyncio
-    async def test_mcp_server_tools(self):
+    def test_mcp_server_tools(self, mcp_tool_names):
         """Test MCP server has expected tools."""
-        tools = await mcp.list_tools()
-
-        tool_names = [tool.name for tool in tools]
-        expected_tools = [
-            "healthcheck",
-            "get_priorities",
-            "get_priority",
-            "create_priority",
-            "update_priority",
-            "get_statuses",
-            "get_status",
-            "create_status",
-            "update_status",
-            "get_folders",
-            "get_folder",
-            "create_folder",
-            "get_test_steps",
-            "create_test_steps",
-            "get_test_script",
-            "create_test_script",
-            "get_test_case",
-            "get_test_case_versions",
-            "get_test_case_version",
-            "get_links",
-            "create_issue_link",
-            "create_web_link",
-            "create_test_case",
-            "update_test_case",
-        ]
-
-        for tool_name in expected_tools:
-            assert tool_name in tool_names, f"Tool {tool_name} not found"
+        missing = EXPECTED_TOOLS - mcp_tool_names
+        assert not missing, f"Tools not registered: {sorted(missing)}"
 
     def test_model_dump_camelcase(self):
         """Test that Pydantic models use camelCase in output."""
@@ -1,7 +1,5 @@
 """Tests for configuration management."""
 
-import os
-
 import pytest
 
 from src.mcp_zephyr_scale_cloud.config import ZephyrConfig
@@ -18,24 +16,21 @@ class TestZephyrConfig:
         assert config.base_url == "https://api.example.com/v2"
         assert config.project_key == "TEST"
 
-    def test_config_from_env_missing_token(self):
+    def test_config_from_env_missing_token(self, monkeypatch):
         """Test creating config when API token is missing."""
         # Clear the token
-        if "ZEPHYR_SCALE_API_TOKEN" in os.environ:
-            del os.environ["ZEPHYR_SCALE_API_TOKEN"]
+        monkeypatch.delenv("ZEPHYR_SCALE_API_TOKEN", raising=False)
 
         with pytest.raises(
             ValueError, match="ZEPHYR_SCALE_API_TOKEN environment variable is required"
         ):
             ZephyrConfig.from_env()
 
-    def test_config_default_values(self, mock_env_vars):
+    def test_config_default_values(self, mock_env_vars, monkeypatch):
         """Test config uses default values when optional vars are missing."""
         # Remove optional variables
-        if "ZEPHYR_SCALE_BASE_URL" in os.environ:
-            del os.environ["ZEPHYR_SCALE_BASE_URL"]
-        if "ZEPHYR_SCALE_DEFAULT_PROJECT_KEY" in os.environ:
-            del os.environ["ZEPHYR_SCALE_DEFAULT_PROJECT_KEY"]
+        monkeypatch.delenv("ZEPHYR_SCALE_BASE_URL", raising=False)
+        monkeypatch.delenv("ZEPHYR_SCALE_DEFAULT_PROJECT_KEY", raising=False)
 
         config = ZephyrConfig.from_env()
 
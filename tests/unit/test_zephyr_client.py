@@ -29,10 +29,9 @@ class TestZephyrClient:
         assert client.headers["Authorization"] == "Bearer test_token_123"
         assert client.headers["Content-Type"] == "application/json"
 
-    @pytest.mark.asyncio
     async def test_healthcheck_success(self, mock_zephyr_client):
         """Test successful healthcheck."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -47,10 +46,9 @@ class TestZephyrClient:
             assert result.is_valid
             assert result.data["status"] == "UP"
 
-    @pytest.mark.asyncio
     async def test_healthcheck_failure(self, mock_zephyr_client):
         """Test healthcheck with HTTP error."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -62,12 +60,11 @@ class TestZephyrClient:
             assert not result.is_valid
             assert "Failed to connect" in result.errors[0]
 
-    @pytest.mark.asyncio
     async def test_get_priorities_success(
         self, mock_zephyr_client, sample_priority_list
     ):
         """Test successful get_priorities."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -83,12 +80,11 @@ class TestZephyrClient:
             assert result.is_valid
             assert len(result.data.values) == 2
 
-    @pytest.mark.asyncio
     async def test_get_priorities_with_project_key(
         self, mock_zephyr_client, sample_priority_list
     ):
         """Test get_priorities with project_key filter."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -110,10 +106,9 @@ class TestZephyrClient:
             assert call_args.kwargs["params"]["projectKey"] == "TEST"
             assert call_args.kwargs["params"]["maxResults"] == 10
 
-    @pytest.mark.asyncio
     async def test_get_priority_success(self, mock_zephyr_client, sample_priority_data):
         """Test successful get_priority."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -129,10 +124,9 @@ class TestZephyrClient:
             assert result.data.id == 1
             assert result.data.name == "High"
 
-    @pytest.mark.asyncio
     async def test_get_priority_not_found(self, mock_zephyr_client):
         """Test get_priority with 404 error."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -148,7 +142,6 @@ class TestZephyrClient:
             assert not result.is_valid
             assert "does not exist" in result.errors[0]
 
-    @pytest.mark.asyncio
     async def test_get_priority_invalid_id(self, mock_zephyr_client):
         """Test get_priority with invalid ID."""
         result = await mock_zephyr_client.get_priority(-1)
@@ -156,12 +149,11 @@ class TestZephyrClient:
         assert not result.is_valid
         assert "positive integer" in result.errors[0]
 
-    @pytest.mark.asyncio
     async def test_create_priority_success(
         self, mock_zephyr_client, sample_created_resource
     ):
         """Test successful create_priority."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -183,10 +175,9 @@ class TestZephyrClient:
             assert result.is_valid
             assert result.data.id == 123
 
-    @pytest.mark.asyncio
     async def test_update_priority_success(self, mock_zephyr_client):
         """Test successful update_priority."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -205,7 +196,6 @@ class TestZephyrClient:
             assert result.is_valid
             assert "updated successfully" in result.data["message"]
 
-    @pytest.mark.asyncio
     async def test_update_priority_invalid_id(self, mock_zephyr_client):
         """Test update_priority with invalid ID."""
         project = ProjectLink(id=123, self="https://api.example.com/projects/123")
@@ -222,10 +212,9 @@ class TestZephyrClient:
 class TestZephyrClientStatus:
     """Test cases for ZephyrClient status operations."""
 
-    @pytest.mark.asyncio
     async def test_get_statuses_success(self, mock_zephyr_client, sample_status_list):
         """Test successful get_statuses."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -242,12 +231,11 @@ class TestZephyrClientStatus:
             assert len(result.data.values) == 3
             assert result.data.values[0].name == "Pass"
 
-    @pytest.mark.asyncio
     async def test_get_statuses_with_filters(
         self, mock_zephyr_client, sample_status_list
     ):
         """Test get_statuses with project and type filters."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -267,10 +255,9 @@ class TestZephyrClientStatus:
             # Verify the URL was called with correct parameters
             mock_client.get.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_get_status_success(self, mock_zephyr_client, sample_status_data):
         """Test successful get_status."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -286,10 +273,9 @@ class TestZephyrClientStatus:
             assert result.data.id == 1
             assert result.data.name == "In Progress"
 
-    @pytest.mark.asyncio
     async def test_get_status_not_found(self, mock_zephyr_client):
         """Test get_status with non-existent status."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -307,7 +293,6 @@ class TestZephyrClientStatus:
             assert not result.is_valid
             assert "does not exist" in result.errors[0]
 
-    @pytest.mark.asyncio
     async def test_get_status_invalid_id(self, mock_zephyr_client):
         """Test get_status with invalid ID."""
         result = await mock_zephyr_client.get_status(-1)
@@ -315,12 +300,11 @@ class TestZephyrClientStatus:
         assert not result.is_valid
         assert "positive integer" in result.errors[0]
 
-    @pytest.mark.asyncio
     async def test_create_status_success(
         self, mock_zephyr_client, sample_created_resource
     ):
         """Test successful create_status."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -343,10 +327,9 @@ class TestZephyrClientStatus:
             assert result.data.id == 123
             assert result.data.key == "CREATED-123"
 
-    @pytest.mark.asyncio
     async def test_update_status_success(self, mock_zephyr_client):
         """Test successful update_status."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -369,7 +352,6 @@ class TestZephyrClientStatus:
             assert result.is_valid
             assert "updated successfully" in result.data["message"]
 
-    @pytest.mark.asyncio
     async def test_update_status_invalid_id(self, mock_zephyr_client):
         """Test update_status with invalid ID."""
         request = UpdateStatusRequest(
@@ -390,10 +372,9 @@ class TestZephyrClientStatus:
 class TestZephyrClientFolder:
     """Test cases for ZephyrClient folder operations."""
 
-    @pytest.mark.asyncio
     async def test_get_folders_success(self, mock_zephyr_client, sample_folder_list):
         """Test successful get_folders."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -410,12 +391,11 @@ class TestZephyrClientFolder:
             assert result.data.values[0].name == "Test Cases"
             assert result.data.values[0].folder_type.value == "TEST_CASE"
 
-    @pytest.mark.asyncio
     async def test_get_folders_with_filters(
         self, mock_zephyr_client, sample_folder_list
     ):
         """Test get_folders with project and folder type filters."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -438,10 +418,9 @@ class TestZephyrClientFolder:
             assert call_args[1]["params"]["folderType"] == "TEST_CASE"
             assert call_args[1]["params"]["maxResults"] == 25
 
-    @pytest.mark.asyncio
     async def test_get_folder_success(self, mock_zephyr_client, sample_folder_data):
         """Test successful get_folder."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -458,10 +437,9 @@ class TestZephyrClientFolder:
             assert result.data.name == "Test Cases"
             assert result.data.folder_type.value == "TEST_CASE"
 
-    @pytest.mark.asyncio
     async def test_get_folder_not_found(self, mock_zephyr_client):
         """Test get_folder with non-existent folder."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -476,7 +454,6 @@ class TestZephyrClientFolder:
             assert not result.is_valid
             assert "does not exist" in result.errors[0]
 
-    @pytest.mark.asyncio
     async def test_get_folder_invalid_id(self, mock_zephyr_client):
         """Test get_folder with invalid ID."""
         result = await mock_zephyr_client.get_folder(-1)
@@ -484,12 +461,11 @@ class TestZephyrClientFolder:
         assert not result.is_valid
         assert "positive integer" in result.errors[0]
 
-    @pytest.mark.asyncio
     async def test_create_folder_success(
         self, mock_zephyr_client, sample_created_resource
     ):
         """Test successful create_folder."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -520,7 +496,6 @@ class TestZephyrClientFolder:
             assert request_data["folderType"] == "TEST_CASE"
             assert request_data["parentId"] == 1
 
-    @pytest.mark.asyncio
     async def test_update_test_case_success(self, mock_zephyr_client):
         """Test successful update_test_case."""
         # Mock the get_test_case call first
@@ -542,54 +517,55 @@ class TestZephyrClientFolder:
         )
 
         # Mock the get_test_case method to return the current test case
-        with patch.object(mock_zephyr_client, "get_test_case") as mock_get:
+        with (
+            patch.object(mock_zephyr_client, "get_test_case") as mock_get,
+            patch.object(httpx, "AsyncClient") as mock_client_class,
+        ):
             mock_get.return_value = ValidationResult(True, data=mock_current_test_case)
 
-            with patch("httpx.AsyncClient") as mock_client_class:
-                mock_client = AsyncMock()
-                mock_client_class.return_value.__aenter__.return_value = mock_client
-
-                mock_response = MagicMock()
-                mock_response.status_code = 200
-                mock_response.raise_for_status.return_value = None
-                mock_client.put.return_value = mock_response
-
-                from src.mcp_zephyr_scale_cloud.schemas.test_case import (
-                    TestCaseUpdateInput,
-                )
-
-                update_input = TestCaseUpdateInput(
-                    name="Updated test case",
-                    objective="Updated objective",
-                    status={"id": 123},
-                    custom_fields={"Component": "Test", "Version": "v2.0"},
-                )
-
-                result = await mock_zephyr_client.update_test_case(
-                    test_case_key="PROJ-T123", test_case_input=update_input
-                )
-
-                assert result.is_valid
-                assert result.data is None  # PUT returns no content
-                mock_get.assert_called_once_with("PROJ-T123")
-                mock_client.put.assert_called_once()
-                call_args = mock_client.put.call_args
-
-                # Check URL
-                assert call_args[0][0].endswith("/testcases/PROJ-T123")
-
-                # Check request data - should contain merged current + update data
-                request_data = call_args[1]["json"]
-                assert request_data["name"] == "Updated test case"  # Updated
-                assert request_data["objective"] == "Updated objective"  # Updated
-                assert request_data["precondition"] == "Original precondition"
-                assert request_data["status"] == {"id": 123}  # Updated
-                assert request_data["customFields"] == {
-                    "Component": "Test",
-                    "Version": "v2.0",
-                }  # Updated
-
-    @pytest.mark.asyncio
+            mock_client = AsyncMock()
+            mock_client_class.return_value.__aenter__.return_value = mock_client
+
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.raise_for_status.return_value = None
+            mock_client.put.return_value = mock_response
+
+            from src.mcp_zephyr_scale_cloud.schemas.test_case import (
+                TestCaseUpdateInput,
+            )
+
+            update_input = TestCaseUpdateInput(
+                name="Updated test case",
+                objective="Updated objective",
+                status={"id": 123},
+                custom_fields={"Component": "Test", "Version": "v2.0"},
+            )
+
+            result = await mock_zephyr_client.update_test_case(
+                test_case_key="PROJ-T123", test_case_input=update_input
+            )
+
+            assert result.is_valid
+            assert result.data is None  # PUT returns no content
+            mock_get.assert_called_once_with("PROJ-T123")
+            mock_client.put.assert_called_once()
+            call_args = mock_client.put.call_args
+
+            # Check URL
+            assert call_args[0][0].endswith("/testcases/PROJ-T123")
+
+            # Check request data - should contain merged current + update data
+            request_data = call_args[1]["json"]
+            assert request_data["name"] == "Updated test case"  # Updated
+            assert request_data["objective"] == "Updated objective"  # Updated
+            assert request_data["precondition"] == "Original precondition"
+            assert request_data["status"] == {"id": 123}  # Updated
+            assert request_data["customFields"] == {
+                "Component": "Test",
+                "Version": "v2.0",
+            }  # Updated
+
     async def test_update_test_case_partial_update(self, mock_zephyr_client):
         """Test update_test_case with partial update."""
         # Mock the get_test_case call first
@@ -610,42 +586,43 @@ class TestZephyrClientFolder:
         )
 
         # Mock the get_test_case method to return the current test case
-        with patch.object(mock_zephyr_client, "get_test_case") as mock_get:
+        with (
+            patch.object(mock_zephyr_client, "get_test_case") as mock_get,
+            patch.object(httpx, "AsyncClient") as mock_client_class,
+        ):
             mock_get.return_value = ValidationResult(True, data=mock_current_test_case)
 
-            with patch("httpx.AsyncClient") as mock_client_class:
-                mock_client = AsyncMock()
-                mock_client_class.return_value.__aenter__.return_value = mock_client
+            mock_client = AsyncMock()
+            mock_client_class.return_value.__aenter__.return_value = mock_client
 
-                mock_response = MagicMock()
-                mock_response.status_code = 200
-                mock_response.raise_for_status.return_value = None
-                mock_client.put.return_value = mock_response
+            mock_response = MagicMock()
+            mock_response.status_code = 200
+            mock_response.raise_for_status.return_value = None
+            mock_client.put.return_value = mock_response
 
-                from src.mcp_zephyr_scale_cloud.schemas.test_case import (
-                    TestCaseUpdateInput,
-                )
+            from src.mcp_zephyr_scale_cloud.schemas.test_case import (
+                TestCaseUpdateInput,
+            )
 
-                update_input = TestCaseUpdateInput(status={"id": 456})
+            update_input = TestCaseUpdateInput(status={"id": 456})
 
-                result = await mock_zephyr_client.update_test_case(
-                    test_case_key="PROJ-T123", test_case_input=update_input
-                )
+            result = await mock_zephyr_client.update_test_case(
+                test_case_key="PROJ-T123", test_case_input=update_input
+            )
 
-                assert result.is_valid
-                assert result.data is None
-                mock_get.assert_called_once_with("PROJ-T123")
-                mock_client.put.assert_called_once()
-                call_args = mock_client.put.call_args
+            assert result.is_valid
+            assert result.data is None
+            mock_get.assert_called_once_with("PROJ-T123")
+            mock_client.put.assert_called_once()
+            call_args = mock_client.put.call_args
 
-                # Check request data - should contain merged current + update data
-                request_data = call_args[1]["json"]
-                assert request_data["status"] == {"id": 456}  # Updated
-                assert request_data["name"] == "Original test case"  # From current
-                assert request_data["objective"] == "Original objective"  # From current
-                # Note: priority/status Link objects are not converted to names yet
+            # Check request data - should contain merged current + update data
+            request_data = call_args[1]["json"]
+            assert request_data["status"] == {"id": 456}  # Updated
+            assert request_data["name"] == "Original test case"  # From current
+            assert request_data["objective"] == "Original objective"  # From current
+            # Note: priority/status Link objects are not converted to names yet
 
-    @pytest.mark.asyncio
     async def test_update_test_case_http_error(self, mock_zephyr_client):
         """Test update_test_case with HTTP error."""
         # Mock the get_test_case call to fail (simulating test case not found)
@@ -681,7 +658,6 @@ class TestZephyrClientGetTestCases:
         config.base_url = "https://api.test.com/v2"
         return ZephyrClient(config)
 
-    @pytest.mark.asyncio
     async def test_get_test_cases_success(self, mock_zephyr_client):
         """Test successful get_test_cases call."""
         from src.mcp_zephyr_scale_cloud.schemas.common import ProjectLink
@@ -709,7 +685,7 @@ class TestZephyrClientGetTestCases:
             "next": "https://api.test.com/v2/testcases?startAt=10&maxResults=10",
         }
 
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -739,7 +715,6 @@ class TestZephyrClientGetTestCases:
             assert call_args[1]["params"]["maxResults"] == 10
             assert call_args[1]["params"]["startAt"] == 0
 
-    @pytest.mark.asyncio
     async def test_get_test_cases_no_filters(self, mock_zephyr_client):
         """Test get_test_cases with no filters."""
         mock_response_data = {
@@ -749,7 +724,7 @@ class TestZephyrClientGetTestCases:
             "next": None,
         }
 
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -774,7 +749,6 @@ class TestZephyrClientGetTestCases:
             assert params["maxResults"] == 10
             assert params["startAt"] == 0
 
-    @pytest.mark.asyncio
     async def test_get_test_cases_invalid_pagination(self, mock_zephyr_client):
         """Test get_test_cases with invalid pagination parameters."""
         result = await mock_zephyr_client.get_test_cases(max_results=-1, start_at=-5)
@@ -784,10 +758,9 @@ class TestZephyrClientGetTestCases:
         assert "max_results must be at least 1" in result.errors
         assert "start_at must be non-negative" in result.errors
 
-    @pytest.mark.asyncio
     async def test_get_test_cases_http_error(self, mock_zephyr_client):
         """Test get_test_cases HTTP error handling."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -805,10 +778,9 @@ class TestZephyrClientGetTestCases:
 class TestZephyrClientTestCycles:
     """Test Zephyr client test cycle methods."""
 
-    @pytest.mark.asyncio
     async def test_get_test_cycles_success(self, mock_zephyr_client):
         """Test successful retrieval of test cycles."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -848,10 +820,9 @@ class TestZephyrClientTestCycles:
             assert result.data.values[0].key == "PROJ-R1"
             assert result.data.values[1].key == "PROJ-R2"
 
-    @pytest.mark.asyncio
     async def test_get_test_cycle_success(self, mock_zephyr_client):
         """Test successful retrieval of a specific test cycle."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -875,12 +846,11 @@ class TestZephyrClientTestCycles:
             assert result.data.name == "Sprint 1 Testing"
             assert result.data.description == "Testing for sprint 1"
 
-    @pytest.mark.asyncio
     async def test_create_test_cycle_success(self, mock_zephyr_client):
         """Test successful creation of a test cycle."""
         from mcp_zephyr_scale_cloud.schemas.test_cycle import TestCycleInput
 
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -901,12 +871,11 @@ class TestZephyrClientTestCycles:
             assert result.data.id == 1
             assert result.data.key == "PROJ-R1"
 
-    @pytest.mark.asyncio
     async def test_update_test_cycle_success_with_body(self, mock_zephyr_client):
         """Test successful update of a test cycle with response body."""
         from mcp_zephyr_scale_cloud.schemas.test_cycle import TestCycle
 
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -936,12 +905,11 @@ class TestZephyrClientTestCycles:
             assert result.is_valid
             assert result.data.name == "Updated Cycle"
 
-    @pytest.mark.asyncio
     async def test_update_test_cycle_success_no_content(self, mock_zephyr_client):
         """Test successful update of a test cycle with 204 No Content."""
         from mcp_zephyr_scale_cloud.schemas.test_cycle import TestCycle
 
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -965,10 +933,9 @@ class TestZephyrClientTestCycles:
             assert result.is_valid
             assert result.data.key == "PROJ-R1"
 
-    @pytest.mark.asyncio
     async def test_get_test_cycle_links_success(self, mock_zephyr_client):
         """Test successful retrieval of test cycle links."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -989,12 +956,11 @@ class TestZephyrClientTestCycles:
             assert len(result.data.issues) == 1
             assert len(result.data.web_links) == 1
 
-    @pytest.mark.asyncio
     async def test_create_test_cycle_issue_link_success(self, mock_zephyr_client):
         """Test successful creation of test cycle issue link."""
         from mcp_zephyr_scale_cloud.schemas.test_case import IssueLinkInput
 
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -1012,12 +978,11 @@ class TestZephyrClientTestCycles:
             assert result.is_valid
             assert result.data.id == 123
 
-    @pytest.mark.asyncio
     async def test_create_test_cycle_issue_link_no_content(self, mock_zephyr_client):
         """Test successful creation of test cycle issue link with 204 No Content."""
         from mcp_zephyr_scale_cloud.schemas.test_case import IssueLinkInput
 
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -1035,12 +1000,11 @@ class TestZephyrClientTestCycles:
             assert result.is_valid
             assert result.data.id == 0
 
-    @pytest.mark.asyncio
     async def test_create_test_cycle_web_link_success(self, mock_zephyr_client):
         """Test successful creation of test cycle web link."""
         from mcp_zephyr_scale_cloud.schemas.test_case import WebLinkInput
 
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -1058,12 +1022,11 @@ class TestZephyrClientTestCycles:
             assert result.is_valid
             assert result.data.id == 456
 
-    @pytest.mark.asyncio
     async def test_create_test_cycle_web_link_no_content(self, mock_zephyr_client):
         """Test successful creation of test cycle web link with 204 No Content."""
         from mcp_zephyr_scale_cloud.schemas.test_case import WebLinkInput
 
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -1085,10 +1048,9 @@ class TestZephyrClientTestCycles:
 class TestZephyrClientTestPlans:
     """Test Zephyr client test plan methods."""
 
-    @pytest.mark.asyncio
     async def test_get_test_plans_success(self, mock_zephyr_client):
         """Test successful retrieval of test plans."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -1128,10 +1090,9 @@ class TestZephyrClientTestPlans:
             assert result.data.values[0].key == "PROJ-P1"
             assert result.data.values[1].key == "PROJ-P2"
 
-    @pytest.mark.asyncio
     async def test_get_test_plan_success(self, mock_zephyr_client):
         """Test successful retrieval of a specific test plan."""
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -1154,12 +1115,11 @@ class TestZephyrClientTestPlans:
             assert result.data.key == "PROJ-P1"
             assert result.data.name == "Integration Test Plan"
 
-    @pytest.mark.asyncio
     async def test_create_test_plan_success(self, mock_zephyr_client):
         """Test successful creation of a test plan."""
         from src.mcp_zephyr_scale_cloud.schemas.test_plan import TestPlanInput
 
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -1177,12 +1137,11 @@ class TestZephyrClientTestPlans:
             assert result.is_valid
             assert result.data.id == 123
 
-    @pytest.mark.asyncio
     async def test_create_test_plan_issue_link_success(self, mock_zephyr_client):
         """Test successful creation of test plan issue link."""
         from src.mcp_zephyr_scale_cloud.schemas.test_case import IssueLinkInput
 
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -1200,12 +1159,11 @@ class TestZephyrClientTestPlans:
             assert result.is_valid
             assert result.data.id == 456
 
-    @pytest.mark.asyncio
     async def test_create_test_plan_issue_link_no_content(self, mock_zephyr_client):
         """Test test plan issue link creation with 204 No Content response."""
         from src.mcp_zephyr_scale_cloud.schemas.test_case import IssueLinkInput
 
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -1223,14 +1181,13 @@ class TestZephyrClientTestPlans:
             assert result.is_valid
             assert result.data.id == 0
 
-    @pytest.mark.asyncio
     async def test_create_test_plan_web_link_success(self, mock_zephyr_client):
         """Test successful creation of test plan web link."""
         from src.mcp_zephyr_scale_cloud.schemas.test_plan import (
             WebLinkInputWithMandatoryDescription,
         )
 
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -1250,14 +1207,13 @@ class TestZephyrClientTestPlans:
             assert result.is_valid
             assert result.data.id == 789
 
-    @pytest.mark.asyncio
     async def test_create_test_plan_test_cycle_link_success(self, mock_zephyr_client):
         """Test successful creation of test plan to test cycle link."""
         from src.mcp_zephyr_scale_cloud.schemas.test_plan import (
             TestPlanTestCycleLinkInput,
         )
 
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 
@@ -1275,7 +1231,6 @@ class TestZephyrClientTestPlans:
             assert result.is_valid
             assert result.data.id == 999
 
-    @pytest.mark.asyncio
     async def test_create_test_plan_test_cycle_link_no_content(
         self, mock_zephyr_client
     ):
@@ -1284,7 +1239,7 @@ class TestZephyrClientTestPlans:
             TestPlanTestCycleLinkInput,
         )
 
-        with patch("httpx.AsyncClient") as mock_client_class:
+        with patch.object(httpx, "AsyncClient") as mock_client_class:
             mock_client = AsyncMock()
             mock_client_class.return_value.__aenter__.return_value = mock_client
 